@@ -1,6 +1,11 @@
 #!/usr/bin/env python3
 """
 Example script demonstrating KMTronic USB Relay API usage
+
+Set the KMTRONIC_RELAY_PORT environment variable (e.g. in CI or production)
+to skip serial port auto-detection:
+
+    KMTRONIC_RELAY_PORT=/dev/ttyUSB0 python example.py
 """
 
 import time
@@ -54,6 +59,7 @@ def main():
         print("\nTip: Specify the port manually if auto-detection fails:")
         print("  relay = KMTronicUSBRelay(port='/dev/ttyUSB0')  # Linux")
         print("  relay = KMTronicUSBRelay(port='COM3')          # Windows")
+        print("Or set the KMTRONIC_RELAY_PORT environment variable.")
     except Exception as e:
         print(f"Error: {e}")
 
@@ -5,6 +5,7 @@ Python API for controlling KMTronic USB relay boards.
 """
 
 from .relay import KMTronicUSB4Relay, RelayState
+from .aio import AsyncKMTronicUSB4Relay
 
 __version__ = "1.0.0"
-__all__ = ["KMTronicUSB4Relay", "RelayState"]
+__all__ = ["KMTronicUSB4Relay", "AsyncKMTronicUSB4Relay", "RelayState"]
@@ -0,0 +1,222 @@
+"""
+Asyncio API for the KMTronic USB 4 RELAY v1.0
+
+This module provides a non-blocking interface built on pyserial-asyncio.
+Commands are handed to the event loop's transport, so callers can overlap
+USB transfers with other work instead of blocking on write/flush.
+
+Requires the optional dependency pyserial-asyncio:
+
+    pip install kmtronic-relay[async]
+
+Note:
+    On Windows each write has a floor of ~15 ms imposed by the event loop.
+    Keep low_latency enabled (the default) so the FTDI bridge does not add
+    its own 16 ms buffering delay on top.
+"""
+
+import asyncio
+import os
+from typing import Optional, Sequence, Union
+
+import serial
+
+from .relay import KMTronicUSB4Relay, RelayState
+
+
+class _RelayProtocol(asyncio.Protocol):
+    """Write-only protocol for the relay board connection."""
+
+    def __init__(self):
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def connection_lost(self, exc):
+        self.transport = None
+
+
+class AsyncKMTronicUSB4Relay:
+    """
+    Asyncio KMTronic USB 4 RELAY v1.0 controller.
+
+    Relay channels are 0-indexed (0-3), matching relay_0 through relay_3
+    of KMTronicUSB4Relay.
+
+    Example:
+        async with AsyncKMTronicUSB4Relay() as relay:
+            await relay.set(0, RelayState.NO)  # Energize relay 0
+            print(relay.get(0))                # Read state
+    """
+
+    def __init__(self, port: Optional[str] = None, low_latency: bool = True):
+        """
+        Initialize and auto-detect the KMTronic USB 4 RELAY v1.0.
+
+        The connection is opened by open() or on entering the async
+        context manager.
+
+        Args:
+            port: Serial port of the relay board (e.g. '/dev/ttyUSB0' or 'COM3').
+                Defaults to the KMTRONIC_RELAY_PORT environment variable;
+                the port is auto-detected if neither is set.
+            low_latency: Request low-latency mode on the serial port
+                (ignored on platforms that do not support it)
+
+        Raises:
+            ValueError: If relay board cannot be auto-detected
+        """
+        self._port = (port or os.environ.get("KMTRONIC_RELAY_PORT")
+                      or KMTronicUSB4Relay._auto_detect_port())
+        if self._port is None:
+            raise ValueError("Could not auto-detect KMTronic USB 4 RELAY v1.0")
+
+        self._low_latency = low_latency
+        self._transport = None
+        self._mask = 0   # Relay states, bit N is relay N
+        self._known = 0  # Relays set since opening the port
+
+    async def open(self):
+        """
+        Open the serial connection.
+
+        Raises:
+            ImportError: If pyserial-asyncio is not installed
+            ConnectionError: If connection to relay board fails
+        """
+        try:
+            import serial_asyncio
+        except ImportError as e:
+            raise ImportError(
+                "AsyncKMTronicUSB4Relay requires pyserial-asyncio "
+                "(pip install kmtronic-relay[async])"
+            ) from e
+
+        loop = asyncio.get_running_loop()
+        try:
+            transport, _ = await serial_asyncio.create_serial_connection(
+                loop,
+                _RelayProtocol,
+                self._port,
+                baudrate=9600,
+                bytesize=serial.EIGHTBITS,
+                parity=serial.PARITY_NONE,
+                stopbits=serial.STOPBITS_ONE,
+            )
+        except serial.SerialException as e:
+            raise ConnectionError(f"Failed to connect to relay board on {self._port}: {e}")
+        self._transport = transport
+
+        if self._low_latency:
+            try:
+                transport.serial.set_low_latency_mode(True)
+            except (AttributeError, NotImplementedError, OSError, ValueError):
+                pass  # Not supported on this platform/driver
+
+    def _write(self, data: bytes):
+        """
+        Queue raw command bytes on the transport.
+
+        Args:
+            data: One or more concatenated 3-byte commands
+        """
+        if self._transport is None or self._transport.is_closing():
+            raise ConnectionError("Serial connection is not open")
+
+        self._transport.write(data)
+
+    async def set(self, channel: int, state: Union[RelayState, bool, int]):
+        """
+        Set a relay state.
+
+        Args:
+            channel: Relay channel (0-3)
+            state: RelayState.NO/True (energize) or RelayState.NC/False (de-energize)
+        """
+        bit = 1 << channel
+        state = int(state)
+        self._write(KMTronicUSB4Relay._CMDS[(channel + 1, bool(state))])
+        self._mask = self._mask | bit if state else self._mask & ~bit
+        self._known |= bit
+
+    async def set_mask(self, new_mask: int):
+        """
+        Set all relay states from a bitmask with a single write.
+
+        Only relays whose state differs from the last state set are sent.
+
+        Args:
+            new_mask: Bitmask of relay states, bit N is relay N
+                (1 for NO (energized), 0 for NC (de-energized))
+        """
+        new_mask &= 0b1111
+        diff = (new_mask ^ self._mask) | (~self._known & 0b1111)
+        if diff:
+            self._write(KMTronicUSB4Relay._mask_commands(diff, new_mask))
+        self._mask = new_mask
+        self._known = 0b1111
+
+    async def set_all(self, states: Sequence[bool]):
+        """
+        Set all relay states with a single write.
+
+        See set_mask(); only relays whose state changed are sent.
+
+        Args:
+            states: Four booleans for relay 0 through relay 3
+                (True for NO (energized), False for NC (de-energized))
+
+        Raises:
+            ValueError: If not exactly four states are given
+        """
+        if len(states) != 4:
+            raise ValueError(f"Expected 4 relay states, got {len(states)}")
+
+        await self.set_mask(sum(1 << channel for channel, state in enumerate(states) if state))
+
+    async def toggle(self, channel: int, delay: float = 1.0):
+        """
+        Energize a relay and de-energize it after a delay.
+
+        Awaiting the delay does not block the event loop, so toggles on
+        several channels can run concurrently (e.g. with asyncio.gather).
+        The relay is de-energized even if the task is cancelled.
+
+        Args:
+            channel: Relay channel (0-3)
+            delay: Seconds before the relay is de-energized again
+        """
+        await self.set(channel, RelayState.NO)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            await self.set(channel, RelayState.NC)
+
+    def get(self, channel: int) -> RelayState:
+        """
+        Get the last state set for a relay.
+
+        Args:
+            channel: Relay channel (0-3)
+
+        Returns:
+            RelayState.NO (Normally Open/energized) or
+            RelayState.NC (Normally Closed/de-energized)
+        """
+        return RelayState(self._mask >> channel & 1)
+
+    def close(self):
+        """Close the serial connection after pending writes are sent."""
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        self.close()
@@ -9,17 +9,120 @@ The relay communicates via USB using a Virtual COM Port (VCP) with the following
 - Parity: None
 """
 
+import errno
+import os
+import queue
+import re
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import weakref
 import serial
 import serial.tools.list_ports
-from enum import Enum
-from typing import Optional
+from enum import IntEnum
+from typing import List, Optional, Sequence, Union
 import time
+from contextlib import nullcontext
 
 
-class RelayState(Enum):
+# Port enumeration cache (comports() can be very slow on Windows hosts
+# with many virtual COM ports)
+_PORT_CACHE_TTL = 1.0  # seconds
+_PORT_CACHE = {"t": 0.0, "ports": None}
+
+# Port descriptions of generic USB-serial bridges used as a detection fallback
+_VENDOR_RE = re.compile(r"ftdi|ch340|usb serial", re.IGNORECASE)
+
+
+def _list_ports() -> list:
+    """
+    List available serial ports, reusing results younger than _PORT_CACHE_TTL.
+
+    Returns:
+        List of port info objects as returned by comports()
+    """
+    now = time.monotonic()
+    if _PORT_CACHE["ports"] is not None and now - _PORT_CACHE["t"] < _PORT_CACHE_TTL:
+        return _PORT_CACHE["ports"]
+
+    ports = list(serial.tools.list_ports.comports())
+    _PORT_CACHE.update(t=now, ports=ports)
+    return ports
+
+
+def _write_port(port: serial.Serial, fd: Optional[int], data: bytes):
+    """
+    Write bytes to a serial port, using os.write() on its tty fd if available.
+
+    Short writes and EAGAIN (the fd is non-blocking) fall back to pyserial
+    for the remainder.
+
+    Args:
+        port: Open serial port
+        fd: File descriptor of the port, or None to always use pyserial
+        data: Bytes to write
+    """
+    if fd is not None:
+        try:
+            written = os.write(fd, data)
+        except BlockingIOError:
+            written = 0
+        if written == len(data):
+            return
+        data = data[written:]
+
+    port.write(data)
+
+
+def _writer_loop(work_queue: queue.Queue, port: serial.Serial, fd: Optional[int],
+                 controller_ref: weakref.ref):
+    """
+    Background writer: coalesce queued commands into single writes.
+
+    Only a weak reference to the controller is held, so an unreferenced
+    controller is still garbage collected (and closed by __del__).
+
+    Args:
+        work_queue: Queue of command bytes; None stops the writer
+        port: Open serial port
+        fd: File descriptor of the port, or None
+        controller_ref: Weak reference to the owning controller
+    """
+    while True:
+        items = [work_queue.get()]
+        while True:
+            try:
+                items.append(work_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        payload = b"".join(item for item in items if item is not None)
+        try:
+            if payload:
+                _write_port(port, fd, payload)
+        except (serial.SerialException, OSError) as e:
+            controller = controller_ref()
+            if controller is not None:
+                controller._writer_error = e
+                # Queued states may not have reached the board; make the
+                # next bulk update resend every relay
+                controller._known = 0
+            controller = None
+        finally:
+            for _ in items:
+                work_queue.task_done()
+
+        if None in items:  # Stop requested by close()
+            return
+
+
+class RelayState(IntEnum):
     """Relay state enumeration."""
-    NO = True   # Normally Open (energized/closed)
-    NC = False  # Normally Closed (de-energized/open)
+    NO = 1  # Normally Open (energized/closed)
+    NC = 0  # Normally Closed (de-energized/open)
+
+    def __str__(self):
+        # Keep "RelayState.NO" output (IntEnum prints the bare int on 3.11+)
+        return f"{type(self).__name__}.{self.name}"
 
 
 class KMTronicUSB4Relay:
@@ -34,18 +137,49 @@ class KMTronicUSB4Relay:
         relay.relay_0.state = RelayState.NO  # Energize relay 0
         relay.relay_1.state = RelayState.NC  # De-energize relay 1
         print(relay.relay_2.state)           # Read state
+
+    Latency:
+        FTDI bridges buffer outgoing data for up to 16 ms (latency_timer)
+        before sending it over USB. By default the controller requests the
+        ASYNC_LOW_LATENCY tty flag after opening the port, which reduces this
+        to ~1 ms. Setting the flag may require CAP_SYS_ADMIN on Linux; as a
+        fallback, lower the timer via sysfs:
+
+            echo 1 > /sys/bus/usb-serial/devices/ttyUSB0/latency_timer
     """
 
     # Command constants
     CMD_PREFIX = 0xFF
 
+    # Precomputed command frames [0xFF, relay_number, state],
+    # keyed by (relay_number, state)
+    _CMDS = {}
+    for _relay in range(1, 5):
+        for _state in (False, True):
+            _CMDS[(_relay, _state)] = bytes([CMD_PREFIX, _relay, 0x01 if _state else 0x00])
+    del _relay, _state
+
+    # USB identification
+    USB_VID = 0x1337
+    USB_PID = 0x0088
+
     class _Relay:
-        """Individual relay channel."""
+        """
+        Individual relay channel.
+
+        A stateless view; relay states are stored in the controller's
+        _mask bitmask (bit N is relay_N).
+        """
+
+        __slots__ = ("_channel", "_controller", "_commands")
 
         def __init__(self, channel: int, controller: 'KMTronicUSB4Relay'):
             self._channel = channel
             self._controller = controller
-            self._state = RelayState.NC
+            # Command frames keyed by state; bool and 0/1 hash and compare
+            # equal to the matching RelayState, anything else is rejected
+            self._commands = {RelayState.NC: controller._CMDS[(channel + 1, False)],
+                              RelayState.NO: controller._CMDS[(channel + 1, True)]}
 
         @property
         def state(self) -> RelayState:
@@ -60,23 +194,65 @@ class KMTronicUSB4Relay:
                 relay.relay_0.state = RelayState.NO
                 current_state = relay.relay_0.state
             """
-            return self._state
+            return RelayState(self._controller._mask >> self._channel & 1)
 
         @state.setter
-        def state(self, value: RelayState):
-            """Set relay state."""
-            self._controller._send_command(self._channel + 1, value.value)
-            self._state = value
+        def state(self, value: Union[RelayState, bool, int]):
+            """Set relay state (RelayState.NO/NC, or True/False)."""
+            controller = self._controller
+            bit = 1 << self._channel
+            try:
+                command = self._commands[value]
+            except (KeyError, TypeError):
+                raise ValueError(f"{value!r} is not a valid RelayState") from None
+            with controller._lock:
+                controller._write(command)
+                controller._mask = controller._mask | bit if value else controller._mask & ~bit
+                controller._known |= bit
 
-    def __init__(self):
+    def __init__(self, port: Optional[str] = None, low_latency: bool = True,
+                 settle_ms: float = 0.0, async_writes: bool = False,
+                 read_timeout: Optional[float] = 0.1,
+                 write_timeout: Optional[float] = 0.1,
+                 inter_byte_timeout: Optional[float] = None):
         """
         Initialize and auto-detect the KMTronic USB 4 RELAY v1.0.
 
+        Args:
+            port: Serial port of the relay board (e.g. '/dev/ttyUSB0' or 'COM3').
+                Defaults to the KMTRONIC_RELAY_PORT environment variable;
+                the port is auto-detected if neither is set.
+            low_latency: Request low-latency mode on the serial port
+                (ignored on platforms that do not support it)
+            settle_ms: Time to wait after opening the port, in milliseconds.
+                Use settle_ms=100 to restore the previous fixed delay.
+            async_writes: Send commands from a background thread. Relay
+                setters return immediately and commands queued in a burst
+                are coalesced into a single write. Use flush_sync() to wait
+                until queued commands have been written.
+            read_timeout: Read timeout of the serial port in seconds
+                (None blocks indefinitely)
+            write_timeout: Write timeout of the serial port in seconds
+                (None blocks indefinitely); writes that time out raise
+                serial.SerialTimeoutException. Together with low_latency
+                this bounds the latency of a stalled USB bridge.
+            inter_byte_timeout: Inter-character read timeout in seconds
+                (None disables it)
+
         Raises:
             ValueError: If relay board cannot be auto-detected
             ConnectionError: If connection to relay board fails
         """
-        self._port = self._auto_detect_port()
+        self._serial = None
+        self._queue = None
+        self._writer = None
+        self._writer_error = None
+        self._fd = None
+        self._timers = {}  # Pending toggle_nowait() timers -> channel
+        # Guards relay state updates, pending timers and closing the port
+        self._lock = threading.RLock()
+
+        self._port = port or os.environ.get("KMTRONIC_RELAY_PORT") or self._auto_detect_port()
         if self._port is None:
             raise ValueError("Could not auto-detect KMTronic USB 4 RELAY v1.0")
 
@@ -88,35 +264,136 @@ class KMTronicUSB4Relay:
                 bytesize=serial.EIGHTBITS,
                 parity=serial.PARITY_NONE,
                 stopbits=serial.STOPBITS_ONE,
-                timeout=1
+                timeout=read_timeout,
+                write_timeout=write_timeout,
+                inter_byte_timeout=inter_byte_timeout
             )
-            time.sleep(0.1)  # Stabilize connection
-        except serial.SerialException as e:
+            try:
+                self._serial.dtr = False
+                self._serial.rts = False
+            except serial.SerialException:
+                raise
+            except OSError as e:
+                if e.errno not in (errno.ENOTTY, errno.EINVAL):
+                    raise
+                # No modem control lines (e.g. virtual ports)
+            self._serial.reset_input_buffer()
+            self._serial.reset_output_buffer()
+            if settle_ms > 0:
+                time.sleep(settle_ms / 1000.0)  # Stabilize connection
+        except (serial.SerialException, OSError) as e:
+            self.close()
             raise ConnectionError(f"Failed to connect to relay board on {self._port}: {e}")
 
-        # Initialize relay channels (0-indexed)
+        if low_latency:
+            try:
+                self._serial.set_low_latency_mode(True)
+            except (AttributeError, NotImplementedError, OSError, ValueError):
+                pass  # Not supported on this platform/driver
+
+        # Write commands straight to the tty file descriptor on POSIX,
+        # bypassing pyserial's Python-level write loop
+        if os.name == "posix":
+            try:
+                self._fd = self._serial.fileno()
+            except (AttributeError, OSError, serial.SerialException):
+                self._fd = None
+
+        if async_writes:
+            self._queue = queue.Queue(maxsize=64)
+            self._writer = threading.Thread(
+                target=_writer_loop,
+                args=(self._queue, self._serial, self._fd, weakref.ref(self)),
+                daemon=True,
+            )
+            self._writer.start()
+
+        # Initialize relay channels (0-indexed). States are kept as a bitmask
+        # (bit N is relay_N); bits not yet in _known have not been set since
+        # opening the port, so their actual state is unknown.
+        self._mask = 0
+        self._known = 0
         self.relay_0 = self._Relay(0, self)
         self.relay_1 = self._Relay(1, self)
         self.relay_2 = self._Relay(2, self)
         self.relay_3 = self._Relay(3, self)
 
-    def _auto_detect_port(self) -> Optional[str]:
+    @classmethod
+    def _auto_detect_port(cls) -> Optional[str]:
         """
         Auto-detect the relay board's serial port.
 
         Returns:
             Port path if found, None otherwise
         """
-        ports = serial.tools.list_ports.comports()
+        ports = _list_ports()
+
+        # Check for FTDI with custom VID/PID (1337:0088) first
         for port in ports:
-            # Check for FTDI with custom VID/PID (1337:0088) first
-            if port.vid == 0x1337 and port.pid == 0x0088:
+            if port.vid == cls.USB_VID and port.pid == cls.USB_PID:
                 return port.device
-            # Fallback to generic FTDI/CH340 detection
-            if any(vendor in port.description.lower() for vendor in ['ftdi', 'ch340', 'usb serial']):
+
+        # Fallback to generic FTDI/CH340 detection
+        for port in ports:
+            if port.description and _VENDOR_RE.search(port.description):
                 return port.device
         return None
 
+    @classmethod
+    def discover_all(cls, limit: Optional[int] = None, **kwargs) -> List['KMTronicUSB4Relay']:
+        """
+        Open every connected relay board with the custom VID/PID (1337:0088).
+
+        Ports are enumerated once (using the port cache) and the boards are
+        opened in parallel.
+
+        Args:
+            limit: Maximum number of boards to open (default: all)
+            **kwargs: Passed to the constructor of each board
+
+        Returns:
+            List of connected controllers, in port enumeration order
+
+        Raises:
+            ConnectionError: If connection to any relay board fails
+                (boards opened so far are closed again)
+
+        Example:
+            for board in KMTronicUSB4Relay.discover_all():
+                board.turn_all_off()
+        """
+        devices = [port.device for port in _list_ports()
+                   if port.vid == cls.USB_VID and port.pid == cls.USB_PID]
+        if limit is not None:
+            devices = devices[:limit]
+        if not devices:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(8, len(devices))) as executor:
+            futures = [executor.submit(cls, port=device, **kwargs) for device in devices]
+
+        boards, errors = [], []
+        for future in futures:
+            try:
+                boards.append(future.result())
+            except ConnectionError as e:
+                errors.append(e)
+        if errors:
+            for board in boards:
+                board.close()
+            raise errors[0]
+        return boards
+
+    @staticmethod
+    def invalidate_port_cache():
+        """
+        Discard cached port enumeration results.
+
+        Call this after plugging in a relay board so the next
+        auto-detection rescans the available ports.
+        """
+        _PORT_CACHE.update(t=0.0, ports=None)
+
     def _send_command(self, relay: int, state: bool):
         """
         Send command to the relay board.
@@ -125,22 +402,203 @@ class KMTronicUSB4Relay:
             relay: Relay number (1-4)
             state: True for NO (energized), False for NC (de-energized)
         """
+        self._write(self._CMDS[(relay, bool(state))])
+
+    def _write(self, data: bytes):
+        """
+        Write raw command bytes to the relay board.
+
+        Args:
+            data: One or more concatenated 3-byte commands
+        """
+        if not self._serial or not self._serial.is_open:
+            raise ConnectionError("Serial connection is not open")
+
+        if self._queue is not None:
+            self._queue.put(data)
+        else:
+            _write_port(self._serial, self._fd, data)
+
+    def drain(self):
+        """
+        Block until all written commands have been transmitted.
+
+        Commands are not flushed individually; call this when the relay
+        state must be on the wire before continuing.
+        """
         if not self._serial or not self._serial.is_open:
             raise ConnectionError("Serial connection is not open")
 
-        # Build command: [0xFF, relay_number, state]
-        command = bytes([self.CMD_PREFIX, relay, 0x01 if state else 0x00])
-        self._serial.write(command)
         self._serial.flush()
 
+    def flush_sync(self):
+        """
+        Wait until all queued commands have been written and transmitted.
+
+        With async_writes=True this first waits for the background writer
+        to drain its queue.
+
+        Raises:
+            ConnectionError: If the background writer failed to write
+        """
+        if self._queue is not None:
+            self._queue.join()
+
+        if self._writer_error is not None:
+            error, self._writer_error = self._writer_error, None
+            raise ConnectionError(f"Failed to write to relay board on {self._port}: {error}")
+
+        self.drain()
+
+    @classmethod
+    def _mask_commands(cls, diff: int, new_mask: int) -> bytes:
+        """
+        Build the concatenated commands for the relays set in a bitmask.
+
+        Args:
+            diff: Bitmask of relays to send (bit N is relay_N)
+            new_mask: Bitmask of relay states (1 for NO, 0 for NC)
+
+        Returns:
+            Concatenated 3-byte commands, one per set bit in diff
+        """
+        payload = bytearray()
+        while diff:
+            bit = diff & -diff  # Lowest set bit
+            payload += cls._CMDS[(bit.bit_length(), bool(new_mask & bit))]
+            diff ^= bit
+        return bytes(payload)
+
+    def set_mask(self, new_mask: int):
+        """
+        Set all relay states from a bitmask with a single write.
+
+        Only relays whose state differs from the last state set are sent
+        (every relay is sent the first time after opening the port). All
+        commands are concatenated and sent in one USB transfer. Call drain()
+        to wait for transmission.
+
+        Args:
+            new_mask: Bitmask of relay states, bit N is relay_N
+                (1 for NO (energized), 0 for NC (de-energized))
+
+        Example:
+            relay.set_mask(0b0101)  # Energize relay_0 and relay_2 only
+        """
+        new_mask &= 0b1111
+        with self._lock:
+            diff = (new_mask ^ self._mask) | (~self._known & 0b1111)
+            if diff:
+                self._write(self._mask_commands(diff, new_mask))
+            self._mask = new_mask
+            self._known = 0b1111
+
+    def set_all(self, states: Sequence[bool]):
+        """
+        Set all relay states with a single write.
+
+        See set_mask(); only relays whose state changed are sent.
+
+        Args:
+            states: Four booleans for relay_0 through relay_3
+                (True for NO (energized), False for NC (de-energized))
+
+        Raises:
+            ValueError: If not exactly four states are given
+
+        Example:
+            relay.set_all([True, False, True, False])
+        """
+        if len(states) != 4:
+            raise ValueError(f"Expected 4 relay states, got {len(states)}")
+
+        self.set_mask(sum(1 << channel for channel, state in enumerate(states) if state))
+
+    def turn_all_on(self):
+        """Energize all relays (NO)."""
+        self.set_mask(0b1111)
+
+    def turn_all_off(self):
+        """De-energize all relays (NC)."""
+        self.set_mask(0)
+
+    def toggle_nowait(self, channel: int, delay: float = 1.0) -> threading.Timer:
+        """
+        Energize a relay and de-energize it after a delay, without blocking.
+
+        The relay is switched on immediately; switching it off is scheduled
+        on a timer thread, so toggles on several channels overlap. Pending
+        switch-offs are sent immediately by close(), and the interpreter
+        waits for them on exit.
+
+        Args:
+            channel: Relay channel (0-3)
+            delay: Seconds before the relay is de-energized again
+
+        Returns:
+            The started timer (call join() to wait for the relay to switch off)
+
+        Example:
+            timers = [relay.toggle_nowait(ch, delay=1.0) for ch in range(4)]
+            for timer in timers:
+                timer.join()
+        """
+        relay = getattr(self, f"relay_{channel}")
+        relay.state = RelayState.NO
+
+        def switch_off():
+            # Hold the lock across the write so close() cannot detach the
+            # port between claiming the timer and sending NC
+            with self._lock:
+                if self._timers.pop(timer, None) is None:
+                    return  # Already handled by close()
+                relay.state = RelayState.NC
+
+        timer = threading.Timer(delay, switch_off)
+        with self._lock:
+            self._timers[timer] = channel
+        timer.start()
+        return timer
+
     def close(self):
-        """Close the serial connection."""
-        if self._serial and self._serial.is_open:
-            self._serial.close()
+        """
+        Close the serial connection after queued commands are written.
+
+        Relays with a pending toggle_nowait() switch-off are de-energized
+        before closing.
+        """
+        # No lock if __init__ never ran
+        with getattr(self, "_lock", None) or nullcontext():
+            pending = getattr(self, "_timers", {})
+            for timer, channel in list(pending.items()):
+                timer.cancel()
+                if self._serial and self._serial.is_open:
+                    getattr(self, f"relay_{channel}").state = RelayState.NC
+            pending.clear()
+
+            if getattr(self, "_writer", None) is not None:
+                self._queue.put(None)
+                if self._writer is not threading.current_thread():
+                    self._writer.join()
+                self._writer = None
+                self._queue = None
+
+            # Detach first so a second close() (e.g. __exit__ then __del__) is a no-op
+            port = getattr(self, "_serial", None)
+            self._serial = None
+            self._fd = None
+            if port is not None and port.is_open:
+                try:
+                    port.flush()
+                finally:
+                    port.close()
 
     def __del__(self):
         """Cleanup on destruction."""
-        self.close()
+        try:
+            self.close()
+        except Exception:
+            pass  # Never raise during garbage collection
 
     def __enter__(self):
         """Context manager entry."""
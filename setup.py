@@ -34,6 +34,9 @@ setup(
     install_requires=[
         "pyserial>=3.5",
     ],
+    extras_require={
+        "async": ["pyserial-asyncio>=0.6"],
+    },
     keywords="kmtronic relay usb hardware automation",
     project_urls={
         "Bug Reports": "https://github.com/HWS-XMS/KMtronicUSBRelay/issues",